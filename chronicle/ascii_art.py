@@ -1,11 +1,15 @@
 
 
+# Chronicle title banner
+TITLE = (
+    ' ██████╗██╗  ██╗ ██████╗ ███╗   ██╗██╗ ██████╗██╗     ███████╗ \n'
+    '██╔════╝██║  ██║██╔═══██╗████╗  ██║██║██╔════╝██║     ██╔════╝ \n'
+    '██║     ███████║██║   ██║██╔██╗ ██║██║██║     ██║     █████╗   \n'
+    '██║     ██╔══██║██║   ██║██║╚██╗██║██║██║     ██║     ██╔══╝   \n'
+    '╚██████╗██║  ██║╚██████╔╝██║ ╚████║██║╚██████╗███████╗███████╗ \n'
+    ' ╚═════╝╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝ ╚═════╝╚══════╝╚══════╝ \n'
+)
+
+
 def print_title():
-    print(''
-          ' ██████╗██╗  ██╗ ██████╗ ███╗   ██╗██╗ ██████╗██╗     ███████╗ \n'
-          '██╔════╝██║  ██║██╔═══██╗████╗  ██║██║██╔════╝██║     ██╔════╝ \n'
-          '██║     ███████║██║   ██║██╔██╗ ██║██║██║     ██║     █████╗   \n'
-          '██║     ██╔══██║██║   ██║██║╚██╗██║██║██║     ██║     ██╔══╝   \n'
-          '╚██████╗██║  ██║╚██████╔╝██║ ╚████║██║╚██████╗███████╗███████╗ \n'
-          ' ╚═════╝╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝ ╚═════╝╚══════╝╚══════╝ \n'
-          '')
\ No newline at end of file
+    print(TITLE)
\ No newline at end of file
@@ -4,23 +4,122 @@ Chronicle - Photo Organization and Cataloging Tool
 A console-based application to organize and catalog photos using metadata.
 """
 
+import os
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from .organize_photos import organize_photos
+from typing import Tuple, Dict, Any
 from . import settings
-from .ascii_art import print_title
+
+
+# Settings as last loaded from the settings file, and that file's (mtime, size)
+_settings_cache = None
+_settings_cache_stamp = None
+
+
+def _get_cached_settings() -> Dict[str, Any]:
+    """
+    Return the current settings, re-reading the settings file only when it
+    has changed since it was last loaded.
+    """
+    global _settings_cache, _settings_cache_stamp
+    try:
+        st = os.stat(settings.get_settings_file())
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    if _settings_cache is None or stamp != _settings_cache_stamp:
+        _settings_cache = settings.load_settings()
+        _settings_cache_stamp = stamp
+    return _settings_cache
+
+
+def _invalidate_settings_cache() -> None:
+    """Force the next _get_cached_settings() call to re-read the settings file."""
+    global _settings_cache
+    _settings_cache = None
+
+
+# Seconds a directory check result is reused
+_DIR_CHECK_TTL = 2.0
+_dir_check_time = 0.0
+
+
+@lru_cache(maxsize=64)
+def _cached_isdir(path: str) -> bool:
+    return os.path.isdir(path)
+
+
+def _is_existing_dir(path: str) -> bool:
+    """
+    Return True if path is an existing directory. Results are reused for up
+    to _DIR_CHECK_TTL seconds so retries of the same path skip the stat call.
+    """
+    global _dir_check_time
+    now = time.monotonic()
+    if now - _dir_check_time > _DIR_CHECK_TTL:
+        _cached_isdir.cache_clear()
+        _dir_check_time = now
+    return _cached_isdir(path)
+
+
+# Choices for the settings prompts: input -> (setting value, display label)
+_MOVE_OPTIONS = {"y": (True, "Yes"), "n": (False, "No")}
+_SCHEME_OPTIONS = {
+    "1": ("camera_year_month", "Camera/Year/Month"),
+    "2": ("year_month", "Year/Month"),
+    "3": ("year_month_camera", "Year/Month/Camera"),
+}
+_MONTH_FORMAT_OPTIONS = {"1": ("full", "Full (01 - January)"), "2": ("number", "Number (01)")}
+_SEPARATE_OPTIONS = {"y": (True, "enabled"), "n": (False, "disabled")}
+
+
+def _choose(prompt: str, options: Dict[str, Tuple[Any, str]], invalid_message: str) -> Tuple[Any, str]:
+    """
+    Prompt until the input is one of 'options' and return the chosen
+    (value, label) pair.
+    """
+    while True:
+        choice = input(prompt).strip().lower()
+        if choice in options:
+            return options[choice]
+        print(invalid_message)
+
+
+# Main menu text below the title
+_MENU_BODY = "\n".join([
+    "=" * 50,
+    "  Photo Organization Tool",
+    "=" * 50,
+    "1. Catalog new photos",
+    "2. Settings",
+    "3. Quit",
+    "=" * 50,
+]) + "\n"
+
+# Settings menu options
+_SETTINGS_MENU = "\n".join([
+    "",
+    "What would you like to configure?",
+    "1. Set default source directory",
+    "2. Set default destination directory",
+    "3. Set default move files preference",
+    "4. Set organization scheme",
+    "5. Set month format",
+    "6. Set file type separation",
+    "7. Clear all settings (reset to defaults)",
+    "8. Back to main menu",
+]) + "\n"
 
 
 def display_menu():
     """Display the main menu options."""
-    print('')
-    print_title()
-    print("=" * 50)
-    print("  Photo Organization Tool")
-    print("=" * 50)
-    print("1. Catalog new photos")
-    print("2. Settings")
-    print("3. Quit")
-    print("=" * 50)
+    from .ascii_art import TITLE
+    
+    # Written in one call to avoid a write per line on slow terminals
+    sys.stdout.write("\n" + TITLE + "\n" + _MENU_BODY)
+    sys.stdout.flush()
 
 
 def get_user_choice() -> str:
@@ -34,7 +133,7 @@ def get_user_choice() -> str:
 
 def get_source_directory(use_default: bool = True) -> Path:
     """Prompt user for source directory."""
-    default_source = settings.get_default_source()
+    default_source = _get_cached_settings().get("default_source") or None
     
     while True:
         if use_default and default_source:
@@ -52,20 +151,19 @@ def get_source_directory(use_default: bool = True) -> Path:
             print("Source directory cannot be empty.")
             continue
         
-        source_path = Path(source).expanduser()
-        if not source_path.exists():
-            print(f"Error: Directory does not exist: {source_path}")
-            continue
-        if not source_path.is_dir():
-            print(f"Error: Path is not a directory: {source_path}")
-            continue
-        
-        return source_path
+        # A Path is only built for the accepted directory
+        expanded = os.path.expanduser(source)
+        if _is_existing_dir(expanded):
+            return Path(expanded)
+        if os.path.exists(expanded):
+            print(f"Error: Path is not a directory: {expanded}")
+        else:
+            print(f"Error: Directory does not exist: {expanded}")
 
 
 def get_destination_directory(use_default: bool = True) -> Path:
     """Prompt user for destination directory."""
-    default_dest = settings.get_default_destination()
+    default_dest = _get_cached_settings().get("default_destination") or None
     
     while True:
         if use_default and default_dest:
@@ -83,31 +181,28 @@ def get_destination_directory(use_default: bool = True) -> Path:
             print("Destination directory cannot be empty.")
             continue
         
-        dest_path = Path(dest).expanduser()
-        
-        # Create directory if it doesn't exist
-        if not dest_path.exists():
-            create = input(f"Directory does not exist. Create it? (y/n): ").strip().lower()
-            if create == 'y':
-                try:
-                    dest_path.mkdir(parents=True, exist_ok=True)
-                    return dest_path
-                except Exception as e:
-                    print(f"Error creating directory: {e}")
-                    continue
-            else:
-                continue
+        # A Path is only built for the accepted directory
+        expanded = os.path.expanduser(dest)
+        if _is_existing_dir(expanded):
+            return Path(expanded)
         
-        if not dest_path.is_dir():
-            print(f"Error: Path is not a directory: {dest_path}")
+        if os.path.exists(expanded):
+            print(f"Error: Path is not a directory: {expanded}")
             continue
         
-        return dest_path
+        # Create directory if it doesn't exist
+        create = input(f"Directory does not exist. Create it? (y/n): ").strip().lower()
+        if create == 'y':
+            try:
+                os.makedirs(expanded, exist_ok=True)
+                return Path(expanded)
+            except Exception as e:
+                print(f"Error creating directory: {e}")
 
 
 def get_move_option(use_default: bool = True) -> bool:
     """Ask user if they want to move or copy files."""
-    default_move = settings.get_default_move_files()
+    default_move = _get_cached_settings().get("default_move_files", False)
     
     while True:
         if use_default:
@@ -132,15 +227,25 @@ def get_move_option(use_default: bool = True) -> bool:
 
 def catalog_photos():
     """Handle the catalog photos workflow."""
+    # Imported here so the menu starts without loading the imaging libraries
+    from .organize_photos import organize_photos
+    
     print("\n--- Catalog New Photos ---")
     
     source = get_source_directory()
     destination = get_destination_directory()
     move_files = get_move_option()
     
+    current_settings = _get_cached_settings()
     print("\nStarting photo organization...")
     try:
-        organize_photos(source, destination, move=move_files, interactive=True)
+        organize_photos(
+            source, destination, move=move_files, interactive=True,
+            organization_scheme=current_settings["organization_scheme"],
+            month_format=current_settings["month_format"],
+            separate_file_types=current_settings["separate_file_types"],
+            checksum_algorithm=current_settings["checksum_algorithm"],
+        )
         print("\n✓ Photo cataloging completed successfully!")
     except Exception as e:
         print(f"\n✗ Error during cataloging: {e}")
@@ -150,39 +255,34 @@ def configure_settings():
     """Handle the settings configuration workflow."""
     print("\n--- Settings ---")
     
-    current_settings = settings.load_settings()
+    current_settings = _get_cached_settings()
+    # Changes are staged here and written to the settings file once on exit;
+    # 'message' confirms the change once it has been saved
+    pending = dict(current_settings)
+    message = None
+    reset = False
     
     # Format organization scheme for display
     scheme = current_settings.get('organization_scheme', 'camera_year_month')
-    scheme_display = {
-        'camera_year_month': 'Camera/Year/Month',
-        'year_month': 'Year/Month',
-        'year_month_camera': 'Year/Month/Camera'
-    }.get(scheme, scheme)
+    scheme_display = {value: label for value, label in _SCHEME_OPTIONS.values()}.get(scheme, scheme)
     
     month_format = current_settings.get('month_format', 'full')
-    month_display = 'Full (01 - January)' if month_format == 'full' else 'Number (01)'
+    month_display = _MONTH_FORMAT_OPTIONS["1" if month_format == 'full' else "2"][1]
     
     separate_types = current_settings.get('separate_file_types', True)
     separate_display = 'Yes' if separate_types else 'No'
     
-    print("\nCurrent settings:")
-    print(f"  Default source: {current_settings.get('default_source', 'Not set')}")
-    print(f"  Default destination: {current_settings.get('default_destination', 'Not set')}")
-    print(f"  Default move files: {current_settings.get('default_move_files', False)}")
-    print(f"  Organization scheme: {scheme_display}")
-    print(f"  Month format: {month_display}")
-    print(f"  Separate file types: {separate_display}")
-    
-    print("\nWhat would you like to configure?")
-    print("1. Set default source directory")
-    print("2. Set default destination directory")
-    print("3. Set default move files preference")
-    print("4. Set organization scheme")
-    print("5. Set month format")
-    print("6. Set file type separation")
-    print("7. Clear all settings (reset to defaults)")
-    print("8. Back to main menu")
+    sys.stdout.write("\n".join([
+        "",
+        "Current settings:",
+        f"  Default source: {current_settings.get('default_source', 'Not set')}",
+        f"  Default destination: {current_settings.get('default_destination', 'Not set')}",
+        f"  Default move files: {current_settings.get('default_move_files', False)}",
+        f"  Organization scheme: {scheme_display}",
+        f"  Month format: {month_display}",
+        f"  Separate file types: {separate_display}",
+    ]) + "\n" + _SETTINGS_MENU)
+    sys.stdout.flush()
     
     while True:
         choice = input("\nEnter your choice (1-8): ").strip()
@@ -191,19 +291,16 @@ def configure_settings():
             print("\nSetting default source directory...")
             source = input("Enter default source directory path (or press Enter to clear): ").strip()
             if source:
-                source_path = Path(source).expanduser()
-                if source_path.exists() and source_path.is_dir():
-                    if settings.set_default_source(str(source_path)):
-                        print(f"✓ Default source set to: {source_path}")
-                    else:
-                        print("✗ Failed to save setting.")
+                expanded = os.path.expanduser(source)
+                if _is_existing_dir(expanded):
+                    source_path = Path(expanded)
+                    pending["default_source"] = str(source_path)
+                    message = f"Default source set to: {source_path}"
                 else:
-                    print(f"✗ Directory does not exist or is not a directory: {source_path}")
+                    print(f"✗ Directory does not exist or is not a directory: {expanded}")
             else:
-                if settings.set_default_source(""):
-                    print("✓ Default source cleared.")
-                else:
-                    print("✗ Failed to save setting.")
+                pending["default_source"] = ""
+                message = "Default source cleared."
             break
         
         elif choice == "2":
@@ -212,35 +309,19 @@ def configure_settings():
             if dest:
                 dest_path = Path(dest).expanduser()
                 # Allow setting even if it doesn't exist (user might create it later)
-                if settings.set_default_destination(str(dest_path)):
-                    print(f"✓ Default destination set to: {dest_path}")
-                else:
-                    print("✗ Failed to save setting.")
+                pending["default_destination"] = str(dest_path)
+                message = f"Default destination set to: {dest_path}"
             else:
-                if settings.set_default_destination(""):
-                    print("✓ Default destination cleared.")
-                else:
-                    print("✗ Failed to save setting.")
+                pending["default_destination"] = ""
+                message = "Default destination cleared."
             break
         
         elif choice == "3":
             print("\nSetting default move files preference...")
-            while True:
-                move = input("Move files by default? (y/n): ").strip().lower()
-                if move == 'y':
-                    if settings.set_default_move_files(True):
-                        print("✓ Default move files set to: Yes")
-                    else:
-                        print("✗ Failed to save setting.")
-                    break
-                elif move == 'n':
-                    if settings.set_default_move_files(False):
-                        print("✓ Default move files set to: No")
-                    else:
-                        print("✗ Failed to save setting.")
-                    break
-                else:
-                    print("Please enter 'y' for yes or 'n' for no.")
+            pending["default_move_files"], label = _choose(
+                "Move files by default? (y/n): ", _MOVE_OPTIONS,
+                "Please enter 'y' for yes or 'n' for no.")
+            message = f"Default move files set to: {label}"
             break
         
         elif choice == "4":
@@ -249,86 +330,59 @@ def configure_settings():
             print("  1. Camera/Year/Month (default)")
             print("  2. Year/Month")
             print("  3. Year/Month/Camera")
-            while True:
-                scheme_choice = input("Enter your choice (1-3): ").strip()
-                if scheme_choice == "1":
-                    if settings.set_organization_scheme("camera_year_month"):
-                        print("✓ Organization scheme set to: Camera/Year/Month")
-                    else:
-                        print("✗ Failed to save setting.")
-                    break
-                elif scheme_choice == "2":
-                    if settings.set_organization_scheme("year_month"):
-                        print("✓ Organization scheme set to: Year/Month")
-                    else:
-                        print("✗ Failed to save setting.")
-                    break
-                elif scheme_choice == "3":
-                    if settings.set_organization_scheme("year_month_camera"):
-                        print("✓ Organization scheme set to: Year/Month/Camera")
-                    else:
-                        print("✗ Failed to save setting.")
-                    break
-                else:
-                    print("Invalid choice. Please enter 1, 2, or 3.")
+            pending["organization_scheme"], label = _choose(
+                "Enter your choice (1-3): ", _SCHEME_OPTIONS,
+                "Invalid choice. Please enter 1, 2, or 3.")
+            message = f"Organization scheme set to: {label}"
             break
         
         elif choice == "5":
             print("\nSetting month format...")
             print("  1. Full (01 - January)")
             print("  2. Number (01)")
-            while True:
-                format_choice = input("Enter your choice (1-2): ").strip()
-                if format_choice == "1":
-                    if settings.set_month_format("full"):
-                        print("✓ Month format set to: Full (01 - January)")
-                    else:
-                        print("✗ Failed to save setting.")
-                    break
-                elif format_choice == "2":
-                    if settings.set_month_format("number"):
-                        print("✓ Month format set to: Number (01)")
-                    else:
-                        print("✗ Failed to save setting.")
-                    break
-                else:
-                    print("Invalid choice. Please enter 1 or 2.")
+            pending["month_format"], label = _choose(
+                "Enter your choice (1-2): ", _MONTH_FORMAT_OPTIONS,
+                "Invalid choice. Please enter 1 or 2.")
+            message = f"Month format set to: {label}"
             break
         
         elif choice == "6":
             print("\nSetting file type separation...")
-            while True:
-                separate = input("Separate JPG/RAW/VIDEO into subfolders? (y/n): ").strip().lower()
-                if separate == 'y':
-                    if settings.set_separate_file_types(True):
-                        print("✓ File type separation enabled")
-                    else:
-                        print("✗ Failed to save setting.")
-                    break
-                elif separate == 'n':
-                    if settings.set_separate_file_types(False):
-                        print("✓ File type separation disabled")
-                    else:
-                        print("✗ Failed to save setting.")
-                    break
-                else:
-                    print("Please enter 'y' for yes or 'n' for no.")
+            pending["separate_file_types"], label = _choose(
+                "Separate JPG/RAW/VIDEO into subfolders? (y/n): ", _SEPARATE_OPTIONS,
+                "Please enter 'y' for yes or 'n' for no.")
+            message = f"File type separation {label}"
             break
         
         elif choice == "7":
             confirm = input("\nAre you sure you want to reset all settings to defaults? (y/n): ").strip().lower()
             if confirm == 'y':
-                if settings.reset_settings():
-                    print("✓ All settings have been reset to defaults.")
-                else:
-                    print("✗ Failed to reset settings.")
+                pending = settings.DEFAULT_SETTINGS.copy()
+                message = "All settings have been reset to defaults."
+                # Always rewrite the file, even if it currently loads as the
+                # defaults, so a corrupt settings file is repaired
+                reset = True
             break
         
         elif choice == "8":
-            return
+            break
         
         else:
             print("Invalid choice. Please enter 1, 2, 3, 4, 5, 6, 7, or 8.")
+    
+    if message is None:
+        return
+    
+    # Write all staged changes at once
+    if (reset or pending != current_settings) and not settings.save_settings(pending):
+        print("✗ Failed to save settings.")
+    else:
+        print("✓ " + message)
+    _invalidate_settings_cache()
+
+
+# Main menu choice -> workflow ("3" quits)
+_MENU_ACTIONS = {"1": catalog_photos, "2": configure_settings}
 
 
 def main():
@@ -339,13 +393,10 @@ def main():
         display_menu()
         choice = get_user_choice()
         
-        if choice == "1":
-            catalog_photos()
-        elif choice == "2":
-            configure_settings()
-        elif choice == "3":
+        if choice == "3":
             print("\nThank you for using Chronicle. Goodbye!")
             break
+        _MENU_ACTIONS[choice]()
 
 
 if __name__ == "__main__":
@@ -1,17 +1,54 @@
 import argparse
 import calendar
+import ctypes
+import errno
 import hashlib
 import json
+import logging
+import multiprocessing
 import os
+import re
 import shutil
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Callable, Iterator, List, Set, TextIO
 
 from PIL import Image
 from PIL.ExifTags import TAGS
 
+try:
+    import blake3
+except ImportError:  # Optional dependency, SHA256 is used without it
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, the json module is used without it
+    orjson = None
+
+try:
+    import exiftool
+except ImportError:  # Optional dependency, files are read one at a time without it
+    exiftool = None
+
+try:
+    import pyexiv2
+    # Exiv2 prints a warning for every unreadable file; failures are handled here
+    pyexiv2.set_log_level(4)
+except ImportError:  # Optional dependency, exifread or Pillow is used without it
+    pyexiv2 = None
+
+try:
+    import exifread
+    # exifread logs a warning for every file without EXIF; those are expected here
+    logging.getLogger("exifread").setLevel(logging.ERROR)
+except ImportError:  # Optional dependency, Pillow is used without it
+    exifread = None
+
 
 # File types to treat as photos
 PHOTO_EXTENSIONS = {".jpg", ".jpeg", ".png", ".heic", ".tif", ".tiff", ".bmp", ".gif"}
@@ -52,9 +89,220 @@ VIDEO_EXTENSIONS = {
     ".ogv",  # Ogg
 }
 
+# Exiv2 keys for the EXIF fields this module reads
+EXIV2_KEYS = {
+    "Exif.Image.Make": "Make",
+    "Exif.Image.Model": "Model",
+    "Exif.Image.DateTime": "DateTime",
+    "Exif.Photo.DateTimeOriginal": "DateTimeOriginal",
+}
+
+# exifread tag names for the EXIF fields this module reads
+EXIFREAD_TAGS = {
+    "Image Make": "Make",
+    "Image Model": "Model",
+    "Image DateTime": "DateTime",
+    "EXIF DateTimeOriginal": "DateTimeOriginal",
+}
+
+# ExifTool tags (in order of preference) for the EXIF fields this module reads.
+# QuickTime tags provide camera and date information for videos.
+EXIFTOOL_TAGS = {
+    "Make": ("EXIF:Make", "QuickTime:Make"),
+    "Model": ("EXIF:Model", "QuickTime:Model"),
+    "DateTime": ("EXIF:ModifyDate",),
+    "DateTimeOriginal": ("EXIF:DateTimeOriginal", "QuickTime:CreateDate"),
+}
+
+# ExifTool arguments: group-prefixed tag names and numeric values (the pyexiftool
+# defaults), plus QuickTimeUTC so QuickTime dates, which are stored in UTC, are
+# returned in local time like EXIF dates and file modification times
+EXIFTOOL_COMMON_ARGS = ["-G", "-n", "-api", "QuickTimeUTC=1"]
+
+# Number of files sent to ExifTool per request
+EXIFTOOL_BATCH_SIZE = 500
+
+# Sony model codes (as cleaned by normalize_camera_name) and their model names,
+# in match priority order
+SONY_MODEL_NAMES = {
+    "ILCE_7M3": "A7III",
+    "ILCE_7M4": "A7IV",
+    "ILCE_7RM3": "A7RIII",
+    "ILCE_7RM4": "A7RIV",
+    "ILCE_7RM5": "A7RV",
+    "ILCE_9": "A9",
+    "ILCE_1": "A1",
+}
+
+# Finds the first model token that needs normalizing in a cleaned model name
+MODEL_TOKEN_RE = re.compile(
+    "(?P<sony>" + "|".join(re.escape(code) for code in SONY_MODEL_NAMES) + ")"
+    "|(?P<dji>(?i:MAVIC))"
+    "|(?P<iphone>(?i:IPHONE))"
+)
+
+# Characters replaced with underscores in camera names
+NAME_SEPARATOR_RE = re.compile(r"[ /\\-]")
+
+# Runs of underscores collapsed into one in camera names
+UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+# Month folder names indexed by month number, for each month format
+MONTH_NAMES_FULL = ("",) + tuple(f"{m:02d} - {calendar.month_name[m]}" for m in range(1, 13))
+MONTH_NAMES_NUMBER = ("",) + tuple(f"{m:02d}" for m in range(1, 13))
+
+# Minimum number of files before metadata is read in worker processes
+POOL_MIN_FILES = 256
+
+# Files handed to each worker process at a time
+POOL_CHUNK_SIZE = 64
+
+# File type category for every file extension that gets organized.
+# Later entries win, so RAW and JPG take precedence as in get_file_type_category.
+EXT_CATEGORY = {
+    **{ext: "OTHER" for ext in PHOTO_EXTENSIONS},
+    **{ext: "VIDEO" for ext in VIDEO_EXTENSIONS},
+    **{ext: "JPG" for ext in JPG_EXTENSIONS},
+    **{ext: "RAW" for ext in RAW_EXTENSIONS},
+}
+
+# Read size used when streaming file contents
+CHUNK_SIZE = 1024 * 1024
+
+# Supported checksum algorithms; the name is also the checksum's key in the log
+CHECKSUM_ALGORITHMS = ("sha256", "blake3")
+
+# Checksum log in the destination directory: one JSON object per line
+CHECKSUM_LOG_NAME = ".checksums.jsonl"
+
+# Checksum log written by earlier versions: a single {path: sha256} JSON object
+LEGACY_CHECKSUM_LOG_NAME = ".checksums.json"
+
+# ioctl request that clones a file's extents on Linux (FICLONE in linux/fs.h)
+FICLONE = 0x40049409
+
+
+def get_extension(name: str) -> str:
+    """Return the lower-cased extension of a file name (same rules as Path.suffix)."""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:].lower()
+    return ""
+
+
+def find_media_files(directory: Path) -> Iterator[Tuple[Path, Tuple[int, int, int]]]:
+    """
+    Recursively yield (path, get_stat_key() tuple) for supported media files
+    under directory. Uses os.scandir so file type checks come from the directory
+    listing, and the stat key from the entry's cached stat.
+    Files that can't be stat'ed and symlinked directories are skipped.
+    """
+    pending = [str(directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif get_extension(entry.name) in EXT_CATEGORY and entry.is_file():
+                            yield Path(entry.path), get_stat_key(entry)
+                    except OSError:
+                        continue
+        except OSError:
+            # Unreadable directory, skip it
+            continue
+
 
 def get_exif(path: Path) -> dict:
-    """Return a dict of EXIF tags for an image, or {} if unavailable."""
+    """
+    Return a dict of EXIF tags for an image, or {} if unavailable.
+    Uses pyexiv2 (Exiv2, C++) or exifread when installed, otherwise Pillow.
+    """
+    if pyexiv2 is not None:
+        return get_exif_pyexiv2(path)
+    if exifread is not None:
+        return get_exif_exifread(path)
+    return get_exif_pillow(path)
+
+
+def get_exif_batch(paths: List[Path]) -> Optional[List[dict]]:
+    """
+    Read EXIF/QuickTime metadata for many files with a single long-lived
+    ExifTool process (requires pyexiftool and the exiftool executable).
+    Returns one dict per path, in the same order, or None if ExifTool is unavailable.
+    """
+    if exiftool is None or not paths:
+        return None
+
+    tag_names = sorted({tag.split(":")[1] for tags in EXIFTOOL_TAGS.values() for tag in tags})
+    metadata_by_path = {}
+    try:
+        with exiftool.ExifToolHelper(common_args=EXIFTOOL_COMMON_ARGS, check_execute=False) as et:
+            for start in range(0, len(paths), EXIFTOOL_BATCH_SIZE):
+                batch = [str(p) for p in paths[start:start + EXIFTOOL_BATCH_SIZE]]
+                for metadata in et.get_tags(batch, tags=tag_names):
+                    metadata_by_path[Path(metadata["SourceFile"])] = metadata
+    except Exception:
+        return None
+
+    exif_list = []
+    for path in paths:
+        metadata = metadata_by_path.get(path, {})
+        exif = {}
+        for key, tags in EXIFTOOL_TAGS.items():
+            for tag in tags:
+                value = str(metadata.get(tag, "")).strip()
+                if value:
+                    exif[key] = value
+                    break
+        exif_list.append(exif)
+    return exif_list
+
+
+def get_exif_pyexiv2(path: Path) -> dict:
+    """Read Make, Model, DateTime and DateTimeOriginal with pyexiv2."""
+    try:
+        img = pyexiv2.Image(str(path))
+        try:
+            data = img.read_exif()
+        finally:
+            img.close()
+    except Exception:
+        return {}
+
+    exif = {}
+    for tag, key in EXIV2_KEYS.items():
+        value = str(data.get(tag, "")).strip()
+        if value:
+            exif[key] = value
+    return exif
+
+
+def get_exif_exifread(path: Path) -> dict:
+    """
+    Read Make, Model, DateTime and DateTimeOriginal with exifread.
+    Parsing stops at DateTimeOriginal and skips MakerNotes and thumbnails.
+    """
+    try:
+        with open(path, "rb") as f:
+            tags = exifread.process_file(
+                f, details=False, stop_tag="DateTimeOriginal", extract_thumbnail=False
+            )
+    except Exception:
+        return {}
+
+    exif = {}
+    for tag, key in EXIFREAD_TAGS.items():
+        if tag in tags:
+            value = str(tags[tag]).strip()
+            if value:
+                exif[key] = value
+    return exif
+
+
+def get_exif_pillow(path: Path) -> dict:
+    """Return a dict of all EXIF tags for an image using Pillow, or {} if unavailable."""
     try:
         with Image.open(path) as img:
             exif_data = img._getexif()
@@ -71,21 +319,36 @@ def get_exif(path: Path) -> dict:
     return exif
 
 
-def get_date_taken(path: Path) -> Optional[datetime]:
+def parse_exif_datetime(date_str: str) -> Optional[datetime]:
+    """
+    Parse an EXIF datetime ("YYYY:MM:DD HH:MM:SS") by slicing its fixed-width
+    fields, which is much faster than datetime.strptime.
+    Returns None if the string is not a valid date.
+    """
+    try:
+        return datetime(
+            int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+            int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]),
+        )
+    except Exception:
+        return None
+
+
+def get_date_taken(path: Path, exif: Optional[dict] = None) -> Optional[datetime]:
     """
     Try to get the 'date taken' from EXIF (for images) or file metadata (for videos).
+    Pass already-read EXIF tags as 'exif' to avoid reading the file again.
     Returns a datetime object or None if not found/parsable.
     """
-    # For images, try EXIF first
-    if path.suffix.lower() not in VIDEO_EXTENSIONS:
+    # For images (or videos with metadata from ExifTool), try EXIF first
+    if exif is None and path.suffix.lower() not in VIDEO_EXTENSIONS:
         exif = get_exif(path)
+    if exif:
         date_str = exif.get("DateTimeOriginal") or exif.get("DateTime")
         if date_str:
-            # EXIF datetime format is typically "YYYY:MM:DD HH:MM:SS"
-            try:
-                return datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-            except Exception:
-                pass
+            date_taken = parse_exif_datetime(date_str)
+            if date_taken:
+                return date_taken
     
     # For videos or if EXIF failed, try file modification time
     try:
@@ -95,6 +358,7 @@ def get_date_taken(path: Path) -> Optional[datetime]:
         return None
 
 
+@lru_cache(maxsize=256)
 def normalize_camera_name(raw_make: str | None, raw_model: str | None) -> str:
     """
     Clean up camera make/model into a folder-friendly name with improved normalization.
@@ -127,12 +391,10 @@ def normalize_camera_name(raw_make: str | None, raw_model: str | None) -> str:
                 # Normal capitalization
                 cleaned_parts.append(part.capitalize())
         s = " ".join(cleaned_parts)
-        # Replace spaces and slashes with underscores
-        for ch in (" ", "/", "\\", "-"):
-            s = s.replace(ch, "_")
+        # Replace spaces, slashes and dashes with underscores
+        s = NAME_SEPARATOR_RE.sub("_", s)
         # Remove multiple underscores
-        while "__" in s:
-            s = s.replace("__", "_")
+        s = UNDERSCORE_RUN_RE.sub("_", s)
         # Remove leading/trailing underscores
         s = s.strip("_")
         return s
@@ -142,33 +404,23 @@ def normalize_camera_name(raw_make: str | None, raw_model: str | None) -> str:
 
     # Normalize common camera model names
     model_normalized = model
+    match = MODEL_TOKEN_RE.search(model)
+    token, matched = (match.lastgroup, match.group()) if match else (None, "")
     # Sony ILCE-7M3 -> A7III, ILCE-7RM4 -> A7RIV, etc.
-    if "ILCE_7M3" in model_normalized or "ILCE_7M3" in model_normalized:
-        model_normalized = "A7III"
-    elif "ILCE_7M4" in model_normalized:
-        model_normalized = "A7IV"
-    elif "ILCE_7RM3" in model_normalized or "ILCE_7RM3A" in model_normalized:
-        model_normalized = "A7RIII"
-    elif "ILCE_7RM4" in model_normalized:
-        model_normalized = "A7RIV"
-    elif "ILCE_7RM5" in model_normalized:
-        model_normalized = "A7RV"
-    elif "ILCE_9" in model_normalized:
-        model_normalized = "A9"
-    elif "ILCE_1" in model_normalized:
-        model_normalized = "A1"
+    if token == "sony":
+        model_normalized = SONY_MODEL_NAMES[matched]
     # DJI normalization
-    elif "MAVIC" in model_normalized.upper() and "3" in model_normalized:
-        model_normalized = "Mavic3"
-    elif "MAVIC" in model_normalized.upper() and "2" in model_normalized:
-        model_normalized = "Mavic2"
+    elif token == "dji":
+        if "3" in model:
+            model_normalized = "Mavic3"
+        elif "2" in model:
+            model_normalized = "Mavic2"
     # iPhone normalization
-    elif "IPHONE" in model_normalized.upper():
+    elif token == "iphone":
         # Extract model number if present
-        parts = model_normalized.split("_")
-        for part in parts:
+        for part in model.split("_"):
             if "IPHONE" in part.upper() and any(c.isdigit() for c in part):
-                model_normalized = part.replace("_", "")
+                model_normalized = part
                 break
 
     # Avoid super-redundant names like "Nikon_Nikon_D5300"
@@ -179,17 +431,19 @@ def normalize_camera_name(raw_make: str | None, raw_model: str | None) -> str:
     return make or model_normalized or "UnknownCamera"
 
 
-def get_camera_name(path: Path) -> str:
+def get_camera_name(path: Path, exif: Optional[dict] = None) -> str:
     """
     Get camera name from EXIF Make/Model (for images) or return UnknownCamera (for videos).
+    Pass already-read EXIF tags as 'exif' to avoid reading the file again.
+    Videos only get a camera name from metadata passed in 'exif' (see get_exif_batch).
     Returns a cleaned string suitable for use as a folder name.
     """
-    # For videos, we can't easily extract camera info from EXIF
-    # Could use file metadata in the future, but for now return UnknownCamera
-    if path.suffix.lower() in VIDEO_EXTENSIONS:
+    # For videos, Pillow/exifread/Exiv2 can't extract camera info
+    if path.suffix.lower() in VIDEO_EXTENSIONS and not exif:
         return "UnknownCamera"
     
-    exif = get_exif(path)
+    if exif is None:
+        exif = get_exif(path)
     make = exif.get("Make")
     model = exif.get("Model")
     # Some EXIF fields can be bytes, convert to str if needed
@@ -201,29 +455,37 @@ def get_camera_name(path: Path) -> str:
     return normalize_camera_name(make, model)
 
 
+def extract_metadata(path: Path, exif: Optional[dict] = None) -> Dict[str, Any]:
+    """
+    Read the camera name and date taken for a file.
+    Pass already-read EXIF tags as 'exif' to avoid reading the file again.
+    Returns a dict with 'camera', 'date' and 'missing_exif' (images without EXIF).
+    """
+    is_video = path.suffix.lower() in VIDEO_EXTENSIONS
+    if exif is None:
+        exif = {} if is_video else get_exif(path)
+    return {
+        "camera": get_camera_name(path, exif),
+        "date": get_date_taken(path, exif),
+        "missing_exif": not is_video and not exif,
+    }
+
+
 def is_raw_file(path: Path) -> bool:
     """Check if file is a RAW format."""
-    return path.suffix.lower() in RAW_EXTENSIONS
+    return EXT_CATEGORY.get(path.suffix.lower()) == "RAW"
 
 
 def is_jpg_file(path: Path) -> bool:
     """Check if file is a JPG format."""
-    return path.suffix.lower() in JPG_EXTENSIONS
+    return EXT_CATEGORY.get(path.suffix.lower()) == "JPG"
 
 
 def get_file_type_category(path: Path) -> str:
     """
     Returns 'RAW', 'JPG', 'VIDEO', or 'OTHER' based on file extension.
     """
-    ext = path.suffix.lower()
-    if ext in RAW_EXTENSIONS:
-        return "RAW"
-    elif ext in JPG_EXTENSIONS:
-        return "JPG"
-    elif ext in VIDEO_EXTENSIONS:
-        return "VIDEO"
-    else:
-        return "OTHER"
+    return EXT_CATEGORY.get(path.suffix.lower(), "OTHER")
 
 
 def format_month_name(month_number: int, format_type: str = "full") -> str:
@@ -232,13 +494,22 @@ def format_month_name(month_number: int, format_type: str = "full") -> str:
     - 'full': 'MM - MonthName' (e.g., '01 - January')
     - 'number': 'MM' (e.g., '01')
     """
-    if 1 <= month_number <= 12:
-        if format_type == "number":
-            return f"{month_number:02d}"
-        else:
-            month_name = calendar.month_name[month_number]
-            return f"{month_number:02d} - {month_name}"
-    return "UnknownMonth"
+    return get_month_formatter(format_type)(month_number)
+
+
+def get_month_formatter(format_type: str = "full") -> Callable[[int], str]:
+    """
+    Return a function that formats month numbers like format_month_name,
+    with format_type resolved once so it can be used in per-file loops.
+    """
+    month_names = MONTH_NAMES_NUMBER if format_type == "number" else MONTH_NAMES_FULL
+
+    def format_month(month_number: int) -> str:
+        if 1 <= month_number <= 12:
+            return month_names[month_number]
+        return "UnknownMonth"
+
+    return format_month
 
 
 def prompt_for_metadata(file_path: Path, month_format: str = "full") -> Tuple[str, str, str]:
@@ -291,64 +562,253 @@ def prompt_for_metadata(file_path: Path, month_format: str = "full") -> Tuple[st
     return camera, year, month
 
 
-def get_unique_target(target: Path) -> Path:
+def get_unique_target(target: Path, dir_cache: Optional[Dict[Path, Set[str]]] = None) -> Path:
     """
     If 'target' already exists, add _1, _2, ... to the filename stem.
+    If 'dir_cache' is given, each folder is listed once and cached there, and
+    the returned name is recorded in it, so later calls need no filesystem checks.
     """
-    if not target.exists():
-        return target
-
     stem, suffix = target.stem, target.suffix
+
+    if dir_cache is None:
+        if not target.exists():
+            return target
+        i = 1
+        while True:
+            candidate = target.with_name(f"{stem}_{i}{suffix}")
+            if not candidate.exists():
+                return candidate
+            i += 1
+
+    folder = target.parent
+    names = dir_cache.get(folder)
+    if names is None:
+        try:
+            names = {name.lower() for name in os.listdir(folder)}
+        except FileNotFoundError:
+            names = set()
+        dir_cache[folder] = names
+
+    # Names are compared case-insensitively so that files are never
+    # overwritten on case-insensitive filesystems
+    candidate = target
     i = 1
-    while True:
+    while candidate.name.lower() in names:
         candidate = target.with_name(f"{stem}_{i}{suffix}")
-        if not candidate.exists():
-            return candidate
         i += 1
+    names.add(candidate.name.lower())
+    return candidate
 
 
-def calculate_checksum(file_path: Path) -> str:
+def calculate_checksum(file_path: Path, algorithm: str = "sha256") -> str:
     """
-    Calculate SHA256 checksum of a file.
+    Calculate the checksum of a file using 'sha256' or 'blake3'.
+    Returns an empty string if the file could not be read.
     """
-    sha256_hash = hashlib.sha256()
     try:
+        if algorithm == "blake3":
+            # Memory-mapped, multi-threaded hashing
+            blake3_hash = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            blake3_hash.update_mmap(file_path)
+            return blake3_hash.hexdigest()
+
         with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: hashes outside the GIL with a reusable buffer
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            sha256_hash = hashlib.sha256()
             # Read file in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
+            for byte_block in iter(lambda: f.read(CHUNK_SIZE), b""):
                 sha256_hash.update(byte_block)
         return sha256_hash.hexdigest()
     except Exception:
         return ""
 
 
-def save_checksum_log(dest_dir: Path, checksum_log: Dict[str, str]) -> None:
+def _new_hasher(algorithm: str):
+    """Return a new hash object for 'sha256' or 'blake3'."""
+    if algorithm == "blake3":
+        return blake3.blake3()
+    return hashlib.sha256()
+
+
+def copy_and_hash(src: Path, dst: Path, algorithm: str = "sha256") -> str:
     """
-    Save checksum log to a JSON file in the destination directory.
+    Copy src to dst like shutil.copy2 while computing the checksum of the data,
+    so the source is read only once.
+    Returns the hex digest of the copied data.
     """
-    log_file = dest_dir / ".checksums.json"
-    try:
-        # Load existing checksums if file exists
-        existing_log = {}
-        if log_file.exists():
+    hasher = _new_hasher(algorithm)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        while True:
+            buf = fsrc.read(CHUNK_SIZE)
+            if not buf:
+                break
+            hasher.update(buf)
+            fdst.write(buf)
+    shutil.copystat(src, dst)
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _libsystem() -> ctypes.CDLL:
+    """Load the macOS system library that provides clonefile()."""
+    return ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+
+
+def try_reflink(src: Path, dst: Path) -> bool:
+    """
+    Try to clone src to dst without copying any data: clonefile() on APFS,
+    the FICLONE ioctl on reflink-capable Linux filesystems (Btrfs, XFS).
+    Metadata is copied like shutil.copy2. Returns False, leaving no dst
+    behind, if cloning is unsupported.
+    """
+    if sys.platform == "darwin":
+        try:
+            if _libsystem().clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+                return False
+        except (OSError, AttributeError):
+            return False
+    elif sys.platform.startswith("linux"):
+        import fcntl
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
             try:
-                with open(log_file, 'r') as f:
-                    existing_log = json.load(f)
-            except Exception:
+                os.unlink(dst)
+            except OSError:
                 pass
-        
-        # Merge with new checksums
-        existing_log.update(checksum_log)
-        
-        # Save updated log
-        with open(log_file, 'w') as f:
-            json.dump(existing_log, f, indent=2)
-    except Exception:
-        pass
+            return False
+    else:
+        return False
+
+    shutil.copystat(src, dst)
+    return True
+
+
+def is_same_filesystem(path_a: Path, path_b: Path) -> bool:
+    """
+    Return True if both paths are on the same filesystem.
+    Paths that don't exist yet are checked through their nearest existing parent.
+    """
+    def device(path: Path) -> int:
+        while True:
+            try:
+                return os.stat(path).st_dev
+            except FileNotFoundError:
+                if path.parent == path:
+                    raise
+                path = path.parent
+
+    try:
+        return device(path_a) == device(path_b)
+    except OSError:
+        return False
+
+
+def format_checksum_entry(rel_path: str, checksum: str, algorithm: str = "sha256",
+                          metadata: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Format one checksum log line: {"path": ..., "<algorithm>": ..., **metadata}.
+    Uses orjson when installed.
+    """
+    entry = {"path": rel_path, algorithm: checksum}
+    if metadata:
+        entry.update(metadata)
+    if orjson is not None:
+        return orjson.dumps(entry).decode() + "\n"
+    return json.dumps(entry) + "\n"
+
+
+def open_checksum_log(dest_dir: Path) -> TextIO:
+    """
+    Open the checksum log in the destination directory for appending.
+    If an interrupted run left a partial last line, it is terminated first
+    so the next entry starts on a line of its own.
+    """
+    log_file = dest_dir / CHECKSUM_LOG_NAME
+    try:
+        with open(log_file, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+    except OSError:
+        # Missing or empty log
+        needs_newline = False
+
+    checksum_log = open(log_file, 'a', encoding="utf-8")
+    if needs_newline:
+        checksum_log.write("\n")
+    return checksum_log
+
+
+def load_checksum_log(dest_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the checksum log from the destination directory, including entries
+    from a legacy .checksums.json file.
+    Returns a dict of relative path -> latest log entry.
+    """
+    entries = {}
+
+    legacy_file = dest_dir / LEGACY_CHECKSUM_LOG_NAME
+    if legacy_file.exists():
+        try:
+            with open(legacy_file, 'r') as f:
+                for rel_path, checksum in json.load(f).items():
+                    entries[rel_path] = {"path": rel_path, "sha256": checksum}
+        except Exception:
+            pass
+
+    log_file = dest_dir / CHECKSUM_LOG_NAME
+    if log_file.exists():
+        loads = orjson.loads if orjson is not None else json.loads
+        try:
+            with open(log_file, 'r', encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = loads(line)
+                        entries[entry["path"]] = entry
+                    except (ValueError, KeyError, TypeError):
+                        # Skip blank, partially written or malformed lines
+                        continue
+        except Exception:
+            pass
+
+    return entries
+
+
+def get_stat_key(entry: os.DirEntry) -> Tuple[int, int, int]:
+    """Return (inode, modification time, size) identifying a file's current contents."""
+    # DirEntry.stat() leaves st_ino as 0 on Windows; inode() is always filled in
+    st = entry.stat()
+    return entry.inode(), int(st.st_mtime), st.st_size
+
+
+def load_metadata_cache(dest_dir: Path) -> Dict[Tuple[int, int, int], Dict[str, Any]]:
+    """
+    Build a metadata cache from the checksum log in the destination directory.
+    Returns a dict of get_stat_key() tuple -> dict with 'camera', 'date' and
+    'missing_exif', in the format returned by extract_metadata.
+    """
+    cache = {}
+    for entry in load_checksum_log(dest_dir).values():
+        try:
+            key = (entry["ino"], entry["mtime"], entry["size"])
+            date = entry["date"]
+            cache[key] = {
+                "camera": entry["camera"],
+                "date": datetime.fromisoformat(date) if date else None,
+                "missing_exif": entry["missing_exif"],
+            }
+        except (KeyError, TypeError, ValueError):
+            # Entries without metadata (older logs) can't be reused
+            continue
+    return cache
 
 
 def organize_photos(src_dir: Path, dest_dir: Path, move: bool = False, interactive: bool = True, 
-                    organization_scheme: str = None, month_format: str = None, separate_file_types: bool = None):
+                    organization_scheme: str = None, month_format: str = None, separate_file_types: bool = None,
+                    checksum_algorithm: str = None):
     """
     Organize photos and videos from src_dir into dest_dir based on organization scheme.
     
@@ -375,6 +835,7 @@ def organize_photos(src_dir: Path, dest_dir: Path, move: bool = False, interacti
         organization_scheme: Organization scheme ('camera_year_month', 'year_month', 'year_month_camera')
         month_format: Month format ('full' or 'number')
         separate_file_types: Whether to separate JPG/RAW/VIDEO into subfolders
+        checksum_algorithm: Checksum algorithm for the checksum log ('sha256' or 'blake3')
     """
     import time
     from . import settings as settings_module
@@ -386,6 +847,14 @@ def organize_photos(src_dir: Path, dest_dir: Path, move: bool = False, interacti
         month_format = settings_module.get_month_format()
     if separate_file_types is None:
         separate_file_types = settings_module.get_separate_file_types()
+    if checksum_algorithm is None:
+        checksum_algorithm = settings_module.get_checksum_algorithm()
+    if checksum_algorithm not in CHECKSUM_ALGORITHMS:
+        print(f"Warning: unknown checksum algorithm {checksum_algorithm!r}, using sha256 checksums instead.")
+        checksum_algorithm = "sha256"
+    if checksum_algorithm == "blake3" and blake3 is None:
+        print("Warning: blake3 is not installed, using sha256 checksums instead.")
+        checksum_algorithm = "sha256"
     
     start_time = time.time()
     src_dir = src_dir.resolve()
@@ -394,6 +863,9 @@ def organize_photos(src_dir: Path, dest_dir: Path, move: bool = False, interacti
     if not src_dir.exists() or not src_dir.is_dir():
         raise ValueError(f"Source directory does not exist or is not a directory: {src_dir}")
 
+    # Moves within one filesystem are plain renames
+    same_fs = is_same_filesystem(src_dir, dest_dir)
+
     print(f"Source: {src_dir}")
     print(f"Destination: {dest_dir}")
     print(f"Mode: {'MOVE' if move else 'COPY'}")
@@ -407,29 +879,43 @@ def organize_photos(src_dir: Path, dest_dir: Path, move: bool = False, interacti
         "files_no_exif": 0,
         "raw_jpg_pairs": 0,
         "cameras": defaultdict(int),
-        "checksum_log": {},
     }
 
     # First pass: collect all files and their metadata
     file_info_list = []
-    all_file_extensions = PHOTO_EXTENSIONS | RAW_EXTENSIONS | VIDEO_EXTENSIONS
-
-    for path in src_dir.rglob("*"):
-        if not path.is_file():
-            continue
-
-        if path.suffix.lower() not in all_file_extensions:
-            continue
-
-        # Get metadata
-        camera_name = get_camera_name(path)
-        date_taken = get_date_taken(path)
+    format_month = get_month_formatter(month_format)
+    scanned = list(find_media_files(src_dir))
+    paths = [path for path, _ in scanned]
+    stat_keys = [stat_key for _, stat_key in scanned]
+
+    # Reuse metadata recorded in the checksum log by earlier runs for files
+    # that are unchanged since (same inode, modification time and size)
+    metadata_cache = load_metadata_cache(dest_dir)
+    cached_list = [metadata_cache.get(key) for key in stat_keys]
+    uncached_paths = [path for path, cached in zip(paths, cached_list) if cached is None]
+
+    # Read metadata for the remaining files in one ExifTool session when available,
+    # otherwise spread EXIF parsing over worker processes for large sets.
+    # Interactive prompts for missing metadata run afterwards in this process.
+    batch_exif = get_exif_batch(uncached_paths)
+    if batch_exif is not None:
+        extracted = [extract_metadata(path, exif) for path, exif in zip(uncached_paths, batch_exif)]
+    elif len(uncached_paths) >= POOL_MIN_FILES:
+        with multiprocessing.Pool(processes=os.cpu_count()) as pool:
+            extracted = pool.map(extract_metadata, uncached_paths, chunksize=POOL_CHUNK_SIZE)
+    else:
+        extracted = [extract_metadata(path) for path in uncached_paths]
+    # Fill in the files that weren't cached, in scan order
+    extracted_iter = iter(extracted)
+    metadata_list = [cached if cached is not None else next(extracted_iter) for cached in cached_list]
+
+    for path, stat_key, metadata in zip(paths, stat_keys, metadata_list):
+        camera_name = metadata["camera"]
+        date_taken = metadata["date"]
         
         # Track missing EXIF (for images only)
-        if path.suffix.lower() not in VIDEO_EXTENSIONS:
-            exif = get_exif(path)
-            if not exif:
-                stats["files_no_exif"] += 1
+        if metadata["missing_exif"]:
+            stats["files_no_exif"] += 1
         
         # Handle missing metadata with interactive fallback
         needs_camera_prompt = (camera_name == "UnknownCamera")
@@ -465,7 +951,7 @@ def organize_photos(src_dir: Path, dest_dir: Path, move: bool = False, interacti
         # Determine year and month
         if date_taken:
             year = f"{date_taken.year:04d}"
-            month = format_month_name(date_taken.month, month_format)
+            month = format_month(date_taken.month)
         else:
             year = "UnknownYear"
             month = "UnknownMonth"
@@ -478,87 +964,128 @@ def organize_photos(src_dir: Path, dest_dir: Path, move: bool = False, interacti
             "month": month,
             "type": file_type,
             "stem": path.stem,  # For matching RAW/JPG pairs
+            # Recorded in the checksum log for later runs
+            "metadata": {
+                "ino": stat_key[0],
+                "mtime": stat_key[1],
+                "size": stat_key[2],
+                "camera": camera_name,
+                "date": date_taken.isoformat() if date_taken else None,
+                "missing_exif": metadata["missing_exif"],
+            },
         })
         
         # Track camera usage
         stats["cameras"][camera_name] += 1
 
-    # Match RAW/JPG pairs (same stem, same camera/year/month)
-    raw_files = {info["stem"].lower(): info for info in file_info_list if info["type"] == "RAW"}
-    jpg_files = {info["stem"].lower(): info for info in file_info_list if info["type"] == "JPG"}
-    
-    for stem in raw_files.keys():
-        if stem in jpg_files:
-            raw_info = raw_files[stem]
-            jpg_info = jpg_files[stem]
-            # Check if they're in the same camera/year/month group
-            if (raw_info["camera"] == jpg_info["camera"] and 
-                raw_info["year"] == jpg_info["year"] and 
-                raw_info["month"] == jpg_info["month"]):
-                stats["raw_jpg_pairs"] += 1
+    # Match RAW/JPG pairs (same stem, same camera/year/month) in one pass;
+    # several RAWs or JPGs with the same stem each pair up at most once
+    files_by_stem: Dict[tuple, Dict[str, list]] = defaultdict(lambda: defaultdict(list))
+    for info in file_info_list:
+        pair_key = (info["stem"].lower(), info["camera"], info["year"], info["month"])
+        files_by_stem[pair_key][info["type"]].append(info)
+    stats["raw_jpg_pairs"] = sum(
+        min(len(by_type["RAW"]), len(by_type["JPG"])) for by_type in files_by_stem.values()
+    )
 
     # Group files by camera/year/month
     groups = defaultdict(list)
+    group_types = defaultdict(set)
     for info in file_info_list:
         key = (info["camera"], info["year"], info["month"])
         groups[key].append(info)
+        group_types[key].add(info["type"])
+
+    # Files that are renamed are hashed up front; hashing releases the GIL, so
+    # threads overlap disk reads and hash computation across files. Copied
+    # files (including moves across filesystems) are hashed while copying.
+    checksums = {}
+    # Copies within one filesystem are cloned when the filesystem supports it
+    try_clone = same_fs and not move
+    if move and same_fs:
+        paths = [info["path"] for info in file_info_list]
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            digests = executor.map(calculate_checksum, paths, [checksum_algorithm] * len(paths))
+            checksums = dict(zip(paths, digests))
 
     # Second pass: organize files
-    for (camera, year, month), files in groups.items():
-        # Check if this group has multiple file types that need separation
-        has_jpg = any(f["type"] == "JPG" for f in files)
-        has_raw = any(f["type"] == "RAW" for f in files)
-        has_video = any(f["type"] == "VIDEO" for f in files)
-        needs_separation = separate_file_types and ((has_jpg and has_raw) or has_video)
-
-        for file_info in files:
-            path = file_info["path"]
-            file_type = file_info["type"]
-
-            # Build folder path based on organization scheme
-            if organization_scheme == "camera_year_month":
-                # CAMERA/YEAR/MONTH
-                base_path = dest_dir / camera / year / month
-            elif organization_scheme == "year_month":
-                # YEAR/MONTH
-                base_path = dest_dir / year / month
-            elif organization_scheme == "year_month_camera":
-                # YEAR/MONTH/CAMERA
-                base_path = dest_dir / year / month / camera
-            else:
-                # Default to camera_year_month
-                base_path = dest_dir / camera / year / month
-
-            # Add file type subfolder if separation is needed
-            if needs_separation and file_type in ("JPG", "RAW", "VIDEO"):
-                folder_path = base_path / file_type
-            else:
-                folder_path = base_path
-
-            folder_path.mkdir(parents=True, exist_ok=True)
-
-            target = folder_path / path.name
-            target = get_unique_target(target)
+    dir_cache: Dict[Path, Set[str]] = {}
+    created_folders = set()
+    # Checksums are appended to the log as files are organized; the log is
+    # opened on the first write so runs without files leave no log behind
+    checksum_log = None
+    try:
+        for (camera, year, month), files in groups.items():
+            # Check if this group has multiple file types that need separation
+            types = group_types[(camera, year, month)]
+            needs_separation = separate_file_types and (("JPG" in types and "RAW" in types) or "VIDEO" in types)
+
+            for file_info in files:
+                path = file_info["path"]
+                file_type = file_info["type"]
+
+                # Build folder path based on organization scheme
+                if organization_scheme == "camera_year_month":
+                    # CAMERA/YEAR/MONTH
+                    base_path = dest_dir / camera / year / month
+                elif organization_scheme == "year_month":
+                    # YEAR/MONTH
+                    base_path = dest_dir / year / month
+                elif organization_scheme == "year_month_camera":
+                    # YEAR/MONTH/CAMERA
+                    base_path = dest_dir / year / month / camera
+                else:
+                    # Default to camera_year_month
+                    base_path = dest_dir / camera / year / month
 
-            # Calculate checksum before moving/copying
-            checksum = calculate_checksum(path)
-            if checksum:
-                # Store checksum with relative path from dest_dir
-                rel_path = str(target.relative_to(dest_dir))
-                stats["checksum_log"][rel_path] = checksum
+                # Add file type subfolder if separation is needed
+                if needs_separation and file_type in ("JPG", "RAW", "VIDEO"):
+                    folder_path = base_path / file_type
+                else:
+                    folder_path = base_path
 
-            if move:
-                shutil.move(str(path), str(target))
-            else:
-                shutil.copy2(str(path), str(target))
+                if folder_path not in created_folders:
+                    folder_path.mkdir(parents=True, exist_ok=True)
+                    created_folders.add(folder_path)
 
-            stats["files_processed"] += 1
-            if stats["files_processed"] % 100 == 0:
-                print(f"{stats['files_processed']} files processed...")
+                target = folder_path / path.name
+                target = get_unique_target(target, dir_cache)
 
-    # Save checksum log
-    if stats["checksum_log"]:
-        save_checksum_log(dest_dir, stats["checksum_log"])
+                if move and same_fs:
+                    checksum = checksums[path]
+                    try:
+                        os.replace(path, target)
+                    except OSError as e:
+                        # Mount points below src_dir/dest_dir can be on other
+                        # filesystems; fall back to copying like shutil.move
+                        if e.errno != errno.EXDEV:
+                            raise
+                        checksum = copy_and_hash(path, target, checksum_algorithm)
+                        os.unlink(path)
+                elif try_clone and try_reflink(path, target):
+                    checksum = calculate_checksum(target, checksum_algorithm)
+                else:
+                    # Stop trying to clone once the filesystem has refused
+                    try_clone = False
+                    checksum = copy_and_hash(path, target, checksum_algorithm)
+                    if move:
+                        os.unlink(path)
+
+                if checksum:
+                    # Log checksum with relative path from dest_dir
+                    rel_path = str(target.relative_to(dest_dir))
+                    if checksum_log is None:
+                        checksum_log = open_checksum_log(dest_dir)
+                    checksum_log.write(format_checksum_entry(
+                        rel_path, checksum, checksum_algorithm, file_info["metadata"]
+                    ))
+
+                stats["files_processed"] += 1
+                if stats["files_processed"] % 100 == 0:
+                    print(f"{stats['files_processed']} files processed...")
+    finally:
+        if checksum_log is not None:
+            checksum_log.close()
 
     # Calculate duration
     total_seconds = int(time.time() - start_time)
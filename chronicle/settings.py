@@ -4,6 +4,7 @@ Stores user preferences in a JSON configuration file.
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -19,6 +20,7 @@ DEFAULT_SETTINGS = {
     "organization_scheme": "camera_year_month",  # Options: "camera_year_month", "year_month", "year_month_camera"
     "month_format": "full",  # Options: "full" (01 - January), "number" (01)
     "separate_file_types": True,  # Separate JPG/RAW/VIDEO into subfolders
+    "checksum_algorithm": "sha256",  # Options: "sha256", "blake3" (requires the blake3 package)
 }
 
 
@@ -54,6 +56,7 @@ def load_settings() -> Dict[str, Any]:
 def save_settings(settings: Dict[str, Any]) -> bool:
     """
     Save settings to the settings file.
+    The file is replaced atomically, so it is never left partially written.
     Returns True if successful, False otherwise.
     """
     settings_file = get_settings_file()
@@ -62,8 +65,10 @@ def save_settings(settings: Dict[str, Any]) -> bool:
         # Ensure parent directory exists
         settings_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(settings_file, 'w') as f:
+        temp_file = settings_file.with_name(settings_file.name + ".tmp")
+        with open(temp_file, 'w') as f:
             json.dump(settings, f, indent=2)
+        os.replace(temp_file, settings_file)
         
         return True
     except (IOError, OSError) as e:
@@ -159,3 +164,16 @@ def set_month_format(format_type: str) -> bool:
 def set_separate_file_types(separate: bool) -> bool:
     """Set the separate file types setting."""
     return set_setting("separate_file_types", separate)
+
+
+def get_checksum_algorithm() -> str:
+    """Get the checksum algorithm setting."""
+    return get_setting("checksum_algorithm", "sha256")
+
+
+def set_checksum_algorithm(algorithm: str) -> bool:
+    """Set the checksum algorithm."""
+    valid_algorithms = ["sha256", "blake3"]
+    if algorithm not in valid_algorithms:
+        raise ValueError(f"Invalid checksum algorithm. Must be one of: {valid_algorithms}")
+    return set_setting("checksum_algorithm", algorithm)
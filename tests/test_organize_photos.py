@@ -0,0 +1,163 @@
+"""
+Tests for the pure helpers in chronicle.organize_photos.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from chronicle.organize_photos import (
+    CHECKSUM_LOG_NAME,
+    LEGACY_CHECKSUM_LOG_NAME,
+    format_checksum_entry,
+    get_unique_target,
+    load_checksum_log,
+    open_checksum_log,
+    normalize_camera_name,
+    parse_exif_datetime,
+)
+
+
+# (make, model, expected folder name), as produced by the original
+# step-by-step implementation of normalize_camera_name
+CAMERA_NAME_CASES = [
+    (None, None, "UnknownCamera"),
+    ("", "", "UnknownCamera"),
+    ("Apple", None, "Apple"),
+    ("Apple", "iPhone 14 Pro", "Apple_Iphone_14_Pro"),
+    ("Apple", "iphone", "Apple_Iphone"),
+    (None, "NIKON D5300", "Nikon_D5300"),
+    ("NIKON CORPORATION", "NIKON D5300", "Nikon_Corporation_Nikon_D5300"),
+    ("Canon", "Canon EOS R5", "Canon_Eos_R5"),
+    ("SONY", "ILCE-7M3", "Sony_A7III"),
+    ("SONY", "ILCE-7RM3A", "Sony_A7RIII"),
+    ("SONY", "ILCE-7RM4", "Sony_A7RIV"),
+    ("SONY", "ILCE-7RM5", "Sony_A7RV"),
+    ("SONY", "ILCE-9", "Sony_A9"),
+    ("SONY", "ILCE-1", "Sony_A1"),
+    ("SONY", "DSC-RX100M7", "Sony_DSC_RX100M7"),
+    (None, "ILCE-7M3", "A7III"),
+    ("DJI", "Mavic 3", "Dji_Mavic3"),
+    ("DJI", "MAVIC2 Pro", "Dji_Mavic2"),
+    ("DJI", "FC3170 Mavic Air", "Dji_Mavic3"),
+    ("FUJIFILM", "X-T4", "Fujifilm_X_t4"),
+    ("OLYMPUS IMAGING CORP.", "E-M1MarkII", "Olympus_Imaging_Corp._E_m1markii"),
+    ("samsung", "SM-G991B", "Samsung_Sm_g991b"),
+    ("", "Model / Name - X", "Model_Name_X"),
+]
+
+
+@pytest.mark.parametrize("make, model, expected", CAMERA_NAME_CASES)
+def test_normalize_camera_name(make, model, expected):
+    assert normalize_camera_name(make, model) == expected
+
+
+@pytest.mark.parametrize("date_str", [
+    "2023:01:02 03:04:05",
+    "1999:12:31 23:59:59",
+    "2024:02:29 00:00:00",
+])
+def test_parse_exif_datetime_matches_strptime(date_str):
+    assert parse_exif_datetime(date_str) == datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
+
+
+def test_parse_exif_datetime_ignores_trailing_time_zone():
+    # ExifTool appends the UTC offset to QuickTime dates read with QuickTimeUTC
+    assert parse_exif_datetime("2023:01:02 03:04:05+02:00") == datetime(2023, 1, 2, 3, 4, 5)
+
+
+@pytest.mark.parametrize("date_str", [
+    "",
+    "0000:00:00 00:00:00",
+    "2023:02:30 12:00:00",
+    "2023:01:02",
+    "    :  :     :  :  ",
+    "not a date",
+])
+def test_parse_exif_datetime_invalid(date_str):
+    assert parse_exif_datetime(date_str) is None
+
+
+def test_get_unique_target_without_cache(tmp_path):
+    (tmp_path / "a.jpg").touch()
+    (tmp_path / "a_1.jpg").touch()
+    assert get_unique_target(tmp_path / "b.jpg") == tmp_path / "b.jpg"
+    assert get_unique_target(tmp_path / "a.jpg") == tmp_path / "a_2.jpg"
+
+
+def test_get_unique_target_with_dir_cache(tmp_path):
+    (tmp_path / "a.jpg").touch()
+    (tmp_path / "a_1.jpg").touch()
+    dir_cache = {}
+    assert get_unique_target(tmp_path / "b.jpg", dir_cache) == tmp_path / "b.jpg"
+    assert get_unique_target(tmp_path / "a.jpg", dir_cache) == tmp_path / "a_2.jpg"
+    # Names handed out earlier are reserved even though no file exists yet
+    assert get_unique_target(tmp_path / "a.jpg", dir_cache) == tmp_path / "a_3.jpg"
+    assert get_unique_target(tmp_path / "b.jpg", dir_cache) == tmp_path / "b_1.jpg"
+
+
+def test_get_unique_target_with_dir_cache_ignores_case(tmp_path):
+    (tmp_path / "IMG_0001.JPG").touch()
+    dir_cache = {}
+    assert get_unique_target(tmp_path / "img_0001.jpg", dir_cache) == tmp_path / "img_0001_1.jpg"
+
+
+def test_get_unique_target_with_dir_cache_missing_folder(tmp_path):
+    folder = tmp_path / "new"
+    dir_cache = {}
+    assert get_unique_target(folder / "a.jpg", dir_cache) == folder / "a.jpg"
+    assert get_unique_target(folder / "a.jpg", dir_cache) == folder / "a_1.jpg"
+
+
+def test_checksum_log_round_trip(tmp_path):
+    metadata = {"ino": 1, "mtime": 2, "size": 3, "camera": "Sony_A7III",
+                "date": "2023-01-02T03:04:05", "missing_exif": False}
+    with open(tmp_path / CHECKSUM_LOG_NAME, "w", encoding="utf-8") as f:
+        f.write(format_checksum_entry("a/one.jpg", "aaa"))
+        f.write(format_checksum_entry("a/two.jpg", "bbb", "blake3", metadata))
+        f.write("{partially written\n")
+        f.write(format_checksum_entry("a/one.jpg", "ccc"))
+
+    assert load_checksum_log(tmp_path) == {
+        # The latest entry for a path wins
+        "a/one.jpg": {"path": "a/one.jpg", "sha256": "ccc"},
+        "a/two.jpg": {"path": "a/two.jpg", "blake3": "bbb", **metadata},
+    }
+
+
+def test_load_checksum_log_reads_legacy_log(tmp_path):
+    with open(tmp_path / LEGACY_CHECKSUM_LOG_NAME, "w") as f:
+        json.dump({"old.jpg": "aaa", "both.jpg": "bbb"}, f)
+    with open(tmp_path / CHECKSUM_LOG_NAME, "w", encoding="utf-8") as f:
+        f.write(format_checksum_entry("both.jpg", "ccc"))
+
+    assert load_checksum_log(tmp_path) == {
+        "old.jpg": {"path": "old.jpg", "sha256": "aaa"},
+        "both.jpg": {"path": "both.jpg", "sha256": "ccc"},
+    }
+
+
+def test_load_checksum_log_without_log(tmp_path):
+    assert load_checksum_log(tmp_path) == {}
+
+
+def test_open_checksum_log_terminates_partial_line(tmp_path):
+    # A run that was interrupted mid-write leaves a line without a newline
+    with open(tmp_path / CHECKSUM_LOG_NAME, "w", encoding="utf-8") as f:
+        f.write('{"path":"x.jpg","sha2')
+
+    with open_checksum_log(tmp_path) as f:
+        f.write(format_checksum_entry("a.jpg", "aaa"))
+
+    assert load_checksum_log(tmp_path) == {"a.jpg": {"path": "a.jpg", "sha256": "aaa"}}
+
+
+def test_open_checksum_log_appends_to_complete_log(tmp_path):
+    with open_checksum_log(tmp_path) as f:
+        f.write(format_checksum_entry("a.jpg", "aaa"))
+    with open_checksum_log(tmp_path) as f:
+        f.write(format_checksum_entry("b.jpg", "bbb"))
+
+    assert (tmp_path / CHECKSUM_LOG_NAME).read_text(encoding="utf-8").count("\n") == 2
+    assert set(load_checksum_log(tmp_path)) == {"a.jpg", "b.jpg"}